@@ -1345,121 +1345,121 @@ Backups will be created in: {self.backup_dir}
         self.logger.info("Installing missing software packages...")
         
         try:
-            installer = SoftwareInstaller(self.config, self.logger)
-            
-            # Install core software
-            success_count = 0
-            total_count = 0
-            errors = []
-            
-            # Check what needs to be installed
-            software_to_install = []
-            
-            if not self._command_exists('brew') and self.config.get('setup_options', {}).get('install_homebrew', True):
-                software_to_install.append('homebrew')
-                self.logger.info("Homebrew not found - will install")
-            
-            # Check for Java 17 specifically
-            java_installed = False
-            if self._command_exists('java'):
-                # Check version
-                try:
-                    result = subprocess.run(['java', '-version'], capture_output=True, text=True)
-                    output = result.stderr + result.stdout
-                    if '17' in output or 'version "17' in output:
-                        java_installed = True
-                        self.logger.info("Java 17 already installed")
-                except:
-                    pass
-            
-            if not java_installed:
-                software_to_install.append('java')
-                self.logger.info("Java 17 not found - will install")
-                
-            if not self._command_exists('mvn'):
-                software_to_install.append('maven')
-                self.logger.info("Maven not found - will install")
-                
-            if not self._command_exists('node'):
-                software_to_install.append('nodejs')
-                self.logger.info("Node.js not found - will install")
-                
-            if not self._command_exists('mysql'):
-                software_to_install.append('mysql')
-                self.logger.info("MySQL not found - will install")
-                
-            if not self._command_exists('yasha'):
-                software_to_install.append('python_packages')
-                self.logger.info("Python packages not found - will install")
-            
-            if not self._command_exists('yarn'):
-                software_to_install.append('yarn')
-                self.logger.info("Yarn not found - will install")
-            
-            if not self._command_exists('lerna'):
-                software_to_install.append('lerna')
-                self.logger.info("Lerna not found - will install")
-            
-            # Install each component
-            self.logger.info(f"Will install {len(software_to_install)} components: {', '.join(software_to_install)}")
-            
-            # Alert user about password requirements
-            if software_to_install:
-                print("\n" + "="*60)
-                print("🔐 SOFTWARE INSTALLATION NOTICE")
-                print("="*60)
-                print("Some installations require administrator privileges.")
-                print("You may be prompted for your Mac login password.")
-                print("The password won't be visible as you type.")
-                print("="*60 + "\n")
-            
-            for software in software_to_install:
-                total_count += 1
-                self.logger.info(f"Installing {software}...")
-                try:
-                    if software == 'homebrew':
-                        success, message = installer.install_homebrew()
-                    elif software == 'java':
-                        success, message = installer.install_java_corretto()
-                    elif software == 'maven':
-                        success, message = installer.install_maven()
-                    elif software == 'nodejs':
-                        success, message = installer.install_nodejs()
-                    elif software == 'mysql':
-                        success, message = installer.install_mysql()
-                    elif software == 'python_packages':
-                        success, message = installer.install_python_packages()
-                    elif software == 'yarn':
-                        success, message = installer.install_yarn()
-                    elif software == 'lerna':
-                        success, message = installer.install_lerna()
-                    else:
-                        success = False
-                        message = f"Unknown software: {software}"
-                    
-                    if success:
-                        success_count += 1
-                        self.logger.info(f"✅ {software}: {message}")
-                    else:
-                        errors.append(f"{software}: {message}")
-                        self.logger.error(f"❌ {software}: {message}")
-                        
-                except Exception as e:
-                    errors.append(f"{software}: {str(e)}")
-                    self.logger.error(f"❌ {software}: {str(e)}")
-            
-            overall_success = success_count == total_count
-            message = f"Software installation: {success_count}/{total_count} successful"
-            if errors:
-                message += f". Errors: {'; '.join(errors)}"
-            
-            return SetupResult(
-                success=overall_success,
-                message=message,
-                stage=SetupStage.SOFTWARE_INSTALL,
-                duration=time.time() - start_time,
-                details={'success_count': success_count, 'total_count': total_count, 'errors': errors}
-            )
+            with SoftwareInstaller(self.config, self.logger) as installer:
+
+                # Install core software
+                success_count = 0
+                total_count = 0
+                errors = []
+
+                # Check what needs to be installed
+                software_to_install = []
+
+                if not self._command_exists('brew') and self.config.get('setup_options', {}).get('install_homebrew', True):
+                    software_to_install.append('homebrew')
+                    self.logger.info("Homebrew not found - will install")
+
+                # Check for Java 17 specifically
+                java_installed = False
+                if self._command_exists('java'):
+                    # Check version
+                    try:
+                        result = subprocess.run(['java', '-version'], capture_output=True, text=True)
+                        output = result.stderr + result.stdout
+                        if '17' in output or 'version "17' in output:
+                            java_installed = True
+                            self.logger.info("Java 17 already installed")
+                    except:
+                        pass
+
+                if not java_installed:
+                    software_to_install.append('java')
+                    self.logger.info("Java 17 not found - will install")
+
+                if not self._command_exists('mvn'):
+                    software_to_install.append('maven')
+                    self.logger.info("Maven not found - will install")
+
+                if not self._command_exists('node'):
+                    software_to_install.append('nodejs')
+                    self.logger.info("Node.js not found - will install")
+
+                if not self._command_exists('mysql'):
+                    software_to_install.append('mysql')
+                    self.logger.info("MySQL not found - will install")
+
+                if not self._command_exists('yasha'):
+                    software_to_install.append('python_packages')
+                    self.logger.info("Python packages not found - will install")
+
+                if not self._command_exists('yarn'):
+                    software_to_install.append('yarn')
+                    self.logger.info("Yarn not found - will install")
+
+                if not self._command_exists('lerna'):
+                    software_to_install.append('lerna')
+                    self.logger.info("Lerna not found - will install")
+
+                # Install each component
+                self.logger.info(f"Will install {len(software_to_install)} components: {', '.join(software_to_install)}")
+
+                # Alert user about password requirements
+                if software_to_install:
+                    print("\n" + "="*60)
+                    print("🔐 SOFTWARE INSTALLATION NOTICE")
+                    print("="*60)
+                    print("Some installations require administrator privileges.")
+                    print("You may be prompted for your Mac login password.")
+                    print("The password won't be visible as you type.")
+                    print("="*60 + "\n")
+
+                for software in software_to_install:
+                    total_count += 1
+                    self.logger.info(f"Installing {software}...")
+                    try:
+                        if software == 'homebrew':
+                            success, message = installer.install_homebrew()
+                        elif software == 'java':
+                            success, message = installer.install_java_corretto()
+                        elif software == 'maven':
+                            success, message = installer.install_maven()
+                        elif software == 'nodejs':
+                            success, message = installer.install_nodejs()
+                        elif software == 'mysql':
+                            success, message = installer.install_mysql()
+                        elif software == 'python_packages':
+                            success, message = installer.install_python_packages()
+                        elif software == 'yarn':
+                            success, message = installer.install_yarn()
+                        elif software == 'lerna':
+                            success, message = installer.install_lerna()
+                        else:
+                            success = False
+                            message = f"Unknown software: {software}"
+
+                        if success:
+                            success_count += 1
+                            self.logger.info(f"✅ {software}: {message}")
+                        else:
+                            errors.append(f"{software}: {message}")
+                            self.logger.error(f"❌ {software}: {message}")
+
+                    except Exception as e:
+                        errors.append(f"{software}: {str(e)}")
+                        self.logger.error(f"❌ {software}: {str(e)}")
+
+                overall_success = success_count == total_count
+                message = f"Software installation: {success_count}/{total_count} successful"
+                if errors:
+                    message += f". Errors: {'; '.join(errors)}"
+
+                return SetupResult(
+                    success=overall_success,
+                    message=message,
+                    stage=SetupStage.SOFTWARE_INSTALL,
+                    duration=time.time() - start_time,
+                    details={'success_count': success_count, 'total_count': total_count, 'errors': errors}
+                )
             
         except Exception as e:
             return SetupResult(
@@ -2372,6 +2372,11 @@ def main():
         action='store_true',
         help='Continue setup despite prerequisite warnings'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-run all validation checks instead of reusing recent results'
+    )
     
     args = parser.parse_args()
     
@@ -2392,6 +2397,8 @@ def main():
         setup.logger.setLevel(logging.DEBUG)
     if args.force_continue:
         setup.config.setdefault('advanced', {})['force_continue'] = True
+    if args.no_cache:
+        setup.config.setdefault('advanced', {})['no_validation_cache'] = True
     
     # Run setup
     success = setup.run_setup()
@@ -32,12 +32,87 @@ import urllib.error
 import tarfile
 import zipfile
 import shutil
+import sysconfig
 import time
 import hashlib
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple
 import tempfile
 
+# PATH lookups are repeated across install methods; cache them per process and
+# clear the cache whenever an installer adds new executables.
+_which = lru_cache(maxsize=64)(shutil.which)
+
+# Binary wheels for pip installs, reused across setup runs; each interpreter
+# and platform gets its own subdirectory (see _pip_install_cached)
+WHEEL_CACHE_DIR = Path.home() / '.cache' / 'legion-setup' / 'wheels'
+
+
+@dataclass(frozen=True)
+class InstallerConfig:
+    """
+    Installer settings resolved once from the setup configuration.
+    
+    Built by SoftwareInstaller at construction time so that a malformed
+    version or path fails immediately, before any download starts.
+    
+    Attributes:
+        java_version: Amazon Corretto major version (e.g. "17")
+        maven_version: Apache Maven version for manual installs
+        node_version: Node.js version for NVM, or "latest"
+        yarn_version: Yarn version for npm, or "latest"
+        lerna_version: Lerna major version for npm
+        es_version: Elasticsearch Docker image tag
+        maven_install_path: Target directory for manual Maven installs
+        checksums: Optional SHA-256 digests keyed by download file name
+    """
+    java_version: str = '17'
+    maven_version: str = '3.9.9'
+    node_version: str = 'latest'
+    yarn_version: str = 'latest'
+    lerna_version: str = '6'
+    es_version: str = '8.0.0'
+    maven_install_path: str = '/usr/local/maven'
+    checksums: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'InstallerConfig':
+        """
+        Build and validate installer settings from the configuration dictionary.
+        
+        Blank values fall back to the defaults above.
+        
+        Raises:
+            ValueError: If a version or path is not a usable string
+        """
+        versions = config.get('versions') or {}
+        paths = config.get('paths') or {}
+        defaults = cls()
+        
+        def _value(section: Dict, key: str, default: str) -> str:
+            value = section.get(key)
+            if value is None or value == '':
+                return default
+            if not isinstance(value, (str, int, float)) or any(c.isspace() for c in str(value)):
+                raise ValueError(f"Invalid installer setting {key!r}: {value!r}")
+            return str(value)
+        
+        return cls(
+            # Corretto packages are named by major version only ("17.0.2" -> "17")
+            java_version=_value(versions, 'jdk', defaults.java_version).split('.')[0],
+            maven_version=_value(versions, 'maven', defaults.maven_version),
+            node_version=_value(versions, 'node', defaults.node_version),
+            yarn_version=_value(versions, 'yarn', defaults.yarn_version),
+            lerna_version=_value(versions, 'lerna', defaults.lerna_version),
+            es_version=_value(versions, 'elasticsearch', defaults.es_version),
+            maven_install_path=str(paths.get('maven_install_path') or defaults.maven_install_path),
+            checksums=dict(config.get('checksums') or {})
+        )
+
+
 class SoftwareInstaller:
     """
     Manages software installation for Legion development environment.
@@ -50,8 +125,13 @@ class SoftwareInstaller:
     - PATH configuration
     - Temporary file management
     
+    Use as a context manager (or call close()) so downloaded archives are
+    removed deterministically when installation finishes.
+    
     Attributes:
         config: Configuration dictionary
+        cfg: Validated InstallerConfig derived from config
+        urls: Pre-formatted download URLs for the configured versions
         logger: Logger instance for output
         platform: Current OS platform (darwin, linux, windows)
         temp_dir: Temporary directory for downloads
@@ -65,17 +145,39 @@ class SoftwareInstaller:
         Args:
             config: Configuration dictionary with version requirements
             logger: Logger instance for output and debugging
+        
+        Raises:
+            ValueError: If the configured versions or paths are invalid
         """
         self.config = config
+        self.cfg = InstallerConfig.from_config(config)
         self.logger = logger
         self.platform = platform.system().lower()
-        self.temp_dir = Path(tempfile.mkdtemp(prefix='legion_setup_'))
         self.install_paths = config.get('paths', {})
         
-    def __del__(self):
-        """Cleanup temporary directory."""
-        if hasattr(self, 'temp_dir') and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        maven_version = self.cfg.maven_version
+        self.urls = SimpleNamespace(
+            homebrew='https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh',
+            corretto_mac=(f"https://corretto.aws/downloads/latest/"
+                          f"amazon-corretto-{self.cfg.java_version}-x64-macos-jdk.pkg"),
+            maven=(f"https://archive.apache.org/dist/maven/maven-3/{maven_version}"
+                   f"/binaries/apache-maven-{maven_version}-bin.tar.gz"),
+            nvm='https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh',
+            es_image=f"docker.elastic.co/elasticsearch/elasticsearch:{self.cfg.es_version}"
+        )
+        
+        self._tmp = tempfile.TemporaryDirectory(prefix='legion_setup_')
+        self.temp_dir = Path(self._tmp.name)
+        
+    def __enter__(self) -> 'SoftwareInstaller':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Remove the temporary download directory and everything in it."""
+        self._tmp.cleanup()
 
     def install_homebrew(self) -> Tuple[bool, str]:
         """
@@ -104,8 +206,8 @@ class SoftwareInstaller:
         
         try:
             # Download and run Homebrew install script
-            install_script = """
-/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"
+            install_script = f"""
+/bin/bash -c "$(curl -fsSL {self.urls.homebrew})"
             """.strip()
             
             result = subprocess.run(install_script, shell=True, 
@@ -114,6 +216,7 @@ class SoftwareInstaller:
             if result.returncode == 0:
                 # Add Homebrew to PATH
                 self._add_to_path('/opt/homebrew/bin')
+                _which.cache_clear()
                 return True, "Homebrew installed successfully"
             else:
                 return False, f"Homebrew installation failed: {result.stderr}"
@@ -125,7 +228,7 @@ class SoftwareInstaller:
 
     def install_java_corretto(self) -> Tuple[bool, str]:
         """
-        Install Amazon Corretto JDK 17.
+        Install the Amazon Corretto JDK major version from versions.jdk (default 17).
         
         Installation methods:
         1. Homebrew cask on macOS
@@ -137,7 +240,7 @@ class SoftwareInstaller:
         Returns:
             Tuple[bool, str]: (Success status, descriptive message)
         """
-        self.logger.info("Installing Amazon Corretto JDK 17...")
+        self.logger.info(f"Installing Amazon Corretto JDK {self.cfg.java_version}...")
         
         if self.platform == 'darwin':
             return self._install_java_macos()
@@ -150,20 +253,19 @@ class SoftwareInstaller:
         """Install Java on macOS."""
         try:
             # Try using Homebrew first
-            if shutil.which('brew'):
+            if _which('brew'):
                 result = subprocess.run(
-                    ['brew', 'install', '--cask', 'corretto17'],
+                    ['brew', 'install', '--cask', f'corretto{self.cfg.java_version}'],
                     capture_output=True, text=True, timeout=300
                 )
                 
                 if result.returncode == 0:
-                    return True, "Amazon Corretto 17 installed via Homebrew"
+                    return True, f"Amazon Corretto {self.cfg.java_version} installed via Homebrew"
             
             # Manual installation if Homebrew fails
-            download_url = "https://corretto.aws/downloads/latest/amazon-corretto-17-x64-macos-jdk.pkg"
-            pkg_file = self.temp_dir / "corretto-17.pkg"
+            pkg_file = self.temp_dir / f"corretto-{self.cfg.java_version}.pkg"
             
-            self._download_file(download_url, pkg_file)
+            self._download_file(self.urls.corretto_mac, pkg_file)
             
             # Alert user about password requirement
             print("\n" + "="*60)
@@ -180,7 +282,7 @@ class SoftwareInstaller:
             )
             
             if result.returncode == 0:
-                return True, "Amazon Corretto 17 installed manually"
+                return True, f"Amazon Corretto {self.cfg.java_version} installed manually"
             else:
                 return False, f"Java installation failed: {result.stderr}"
                 
@@ -191,21 +293,21 @@ class SoftwareInstaller:
         """Install Java on Linux."""
         try:
             # Ubuntu/Debian
-            if shutil.which('apt-get'):
+            if _which('apt-get'):
                 commands = [
                     ['sudo', 'apt', 'update'],
                     ['sudo', 'apt', 'install', '-y', 'wget', 'software-properties-common'],
                     ['wget', '-O', '-', 'https://apt.corretto.aws/corretto.key', '|', 'sudo', 'apt-key', 'add', '-'],
                     ['sudo', 'add-apt-repository', 'deb https://apt.corretto.aws stable main'],
                     ['sudo', 'apt', 'update'],
-                    ['sudo', 'apt', 'install', '-y', 'java-17-amazon-corretto-jdk']
+                    ['sudo', 'apt', 'install', '-y', f'java-{self.cfg.java_version}-amazon-corretto-jdk']
                 ]
             
             # RHEL/CentOS/Fedora
-            elif shutil.which('yum') or shutil.which('dnf'):
-                package_manager = 'dnf' if shutil.which('dnf') else 'yum'
+            elif _which('yum') or _which('dnf'):
+                package_manager = 'dnf' if _which('dnf') else 'yum'
                 commands = [
-                    ['sudo', package_manager, 'install', '-y', 'java-17-amazon-corretto-devel']
+                    ['sudo', package_manager, 'install', '-y', f'java-{self.cfg.java_version}-amazon-corretto-devel']
                 ]
             
             else:
@@ -216,7 +318,7 @@ class SoftwareInstaller:
                 if result.returncode != 0:
                     return False, f"Command failed: {' '.join(command)}"
             
-            return True, "Amazon Corretto 17 installed successfully"
+            return True, f"Amazon Corretto {self.cfg.java_version} installed successfully"
             
         except Exception as e:
             return False, f"Java installation error: {str(e)}"
@@ -225,11 +327,11 @@ class SoftwareInstaller:
         """Install Apache Maven."""
         self.logger.info("Installing Apache Maven...")
         
-        version = self.config.get('versions', {}).get('maven', '3.9.9')
+        version = self.cfg.maven_version
         
         try:
             # Try Homebrew on macOS first
-            if self.platform == 'darwin' and shutil.which('brew'):
+            if self.platform == 'darwin' and _which('brew'):
                 result = subprocess.run(
                     ['brew', 'install', 'maven'],
                     capture_output=True, text=True, timeout=300
@@ -248,13 +350,12 @@ class SoftwareInstaller:
         """Install Maven manually."""
         try:
             # Download Maven
-            download_url = f"https://archive.apache.org/dist/maven/maven-3/{version}/binaries/apache-maven-{version}-bin.tar.gz"
             maven_archive = self.temp_dir / f"apache-maven-{version}-bin.tar.gz"
             
-            self._download_file(download_url, maven_archive)
+            self._download_file(self.urls.maven, maven_archive)
             
             # Extract Maven
-            install_path = Path(self.install_paths.get('maven_install_path', '/usr/local/maven'))
+            install_path = Path(self.cfg.maven_install_path)
             install_path.parent.mkdir(parents=True, exist_ok=True)
             
             with tarfile.open(maven_archive, 'r:gz') as tar:
@@ -269,6 +370,7 @@ class SoftwareInstaller:
             # Add to PATH
             maven_bin = install_path / 'bin'
             self._add_to_path(str(maven_bin))
+            _which.cache_clear()
             
             return True, f"Maven {version} installed to {install_path}"
             
@@ -292,9 +394,9 @@ class SoftwareInstaller:
         """
         self.logger.info("Installing Node.js...")
         
-        node_version = self.config.get('versions', {}).get('node', 'latest')
-        yarn_version = self.config.get('versions', {}).get('yarn', 'latest')
-        lerna_version = self.config.get('versions', {}).get('lerna', '6')
+        node_version = self.cfg.node_version
+        yarn_version = self.cfg.yarn_version
+        lerna_version = self.cfg.lerna_version
         
         try:
             # Install NVM first
@@ -321,7 +423,7 @@ export NVM_DIR="$HOME/.nvm"
 {node_install_cmd}
 {node_use_cmd}
 {node_alias_cmd}
-npm install -g yarn@{yarn_version if yarn_version != 'latest' else 'latest'}
+npm install -g yarn@{yarn_version}
 npm install -g lerna@{lerna_version}
             """.strip()
             
@@ -331,6 +433,7 @@ npm install -g lerna@{lerna_version}
             )
             
             if result.returncode == 0:
+                _which.cache_clear()
                 return True, f"Node.js {version_display}, Yarn, and Lerna {lerna_version} installed"
             else:
                 return False, f"Node.js installation failed: {result.stderr}"
@@ -342,8 +445,8 @@ npm install -g lerna@{lerna_version}
         """Install Node Version Manager (NVM)."""
         try:
             # Download and install NVM
-            install_script = """
-curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
+            install_script = f"""
+curl -o- {self.urls.nvm} | bash
             """.strip()
             
             result = subprocess.run(
@@ -377,7 +480,7 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
     def _install_mysql_macos(self) -> Tuple[bool, str]:
         """Install MySQL on macOS."""
         try:
-            if shutil.which('brew'):
+            if _which('brew'):
                 # Install MySQL using Homebrew
                 result = subprocess.run(
                     ['brew', 'install', 'mysql'],
@@ -400,7 +503,7 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
         """Install MySQL on Linux."""
         try:
             # Ubuntu/Debian
-            if shutil.which('apt-get'):
+            if _which('apt-get'):
                 commands = [
                     ['sudo', 'apt', 'update'],
                     ['sudo', 'apt', 'install', '-y', 'mysql-server-8.0'],
@@ -409,8 +512,8 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
                 ]
             
             # RHEL/CentOS/Fedora
-            elif shutil.which('yum') or shutil.which('dnf'):
-                package_manager = 'dnf' if shutil.which('dnf') else 'yum'
+            elif _which('yum') or _which('dnf'):
+                package_manager = 'dnf' if _which('dnf') else 'yum'
                 commands = [
                     ['sudo', package_manager, 'install', '-y', 'mysql-server'],
                     ['sudo', 'systemctl', 'start', 'mysqld'],
@@ -498,14 +601,15 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
         
         try:
             # Install pipx if not available
-            if not shutil.which('pipx'):
-                if self.platform == 'darwin' and shutil.which('brew'):
+            if not _which('pipx'):
+                if self.platform == 'darwin' and _which('brew'):
                     subprocess.run(['brew', 'install', 'pipx'], check=True)
                 else:
                     subprocess.run([sys.executable, '-m', 'pip', 'install', 'pipx'], check=True)
                 
                 # Ensure pipx path
                 subprocess.run(['pipx', 'ensurepath'], check=True)
+                _which.cache_clear()
             
             # Install yasha using pipx
             result = subprocess.run(
@@ -518,10 +622,7 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
             
             # Install other packages using pip
             other_packages = ['mysql-connector-python', 'PyYAML']
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'install'] + other_packages,
-                capture_output=True, text=True
-            )
+            result = self._pip_install_cached(other_packages)
             
             if result.returncode != 0:
                 return False, f"Failed to install Python packages: {result.stderr}"
@@ -530,6 +631,50 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
             
         except Exception as e:
             return False, f"Python packages installation error: {str(e)}"
+    
+    def _pip_install_cached(self, packages: List[str]) -> subprocess.CompletedProcess:
+        """
+        Install packages with pip from a local binary wheel cache.
+        
+        Wheels (including dependencies) are kept in a subdirectory of
+        ~/.cache/legion-setup/wheels per interpreter ABI and platform, and
+        installed offline without resolving against PyPI. When the offline
+        install fails (empty cache, changed package list or versions) the
+        wheels are downloaded again and the install retried; if that still
+        fails, packages are installed from PyPI.
+        """
+        pip = [sys.executable, '-m', 'pip']
+        quiet_flags = ['--disable-pip-version-check']
+        wheel_dir = WHEEL_CACHE_DIR / f"{sys.implementation.cache_tag}-{sysconfig.get_platform()}"
+        offline_install = pip + ['install'] + quiet_flags + ['--no-index', '--find-links', str(wheel_dir)] + packages
+        
+        if any(wheel_dir.glob('*.whl')):
+            result = subprocess.run(offline_install, capture_output=True, text=True)
+            if result.returncode == 0:
+                return result
+            self.logger.info("Cached wheels are out of date, refreshing them")
+        
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            download = subprocess.run(
+                pip + ['download'] + quiet_flags +
+                ['--dest', str(wheel_dir), '--only-binary=:all:'] + packages,
+                capture_output=True, text=True, timeout=600
+            )
+            download_error = download.stderr.strip() if download.returncode != 0 else None
+        except subprocess.TimeoutExpired:
+            download_error = "wheel download timed out"
+        
+        if download_error is None:
+            result = subprocess.run(offline_install, capture_output=True, text=True)
+            if result.returncode == 0:
+                return result
+            self.logger.warning("Offline wheel install failed, installing from PyPI")
+        else:
+            self.logger.warning(f"Could not cache wheels, installing from PyPI: {download_error}")
+        
+        return subprocess.run(pip + ['install'] + quiet_flags + packages,
+                              capture_output=True, text=True)
 
     def setup_docker_elasticsearch(self) -> Tuple[bool, str]:
         """Setup Docker and Elasticsearch."""
@@ -546,8 +691,8 @@ curl -o- https://raw.githubusercontent.com/nvm-sh/nvm/v0.39.0/install.sh | bash
                          capture_output=True, text=True)
             
             # Pull Elasticsearch image
-            es_version = self.config.get('versions', {}).get('elasticsearch', '8.0.0')
-            es_image = f"docker.elastic.co/elasticsearch/elasticsearch:{es_version}"
+            es_version = self.cfg.es_version
+            es_image = self.urls.es_image
             
             result = subprocess.run(
                 ['docker', 'pull', es_image],
@@ -679,6 +824,16 @@ services:
                 
         except urllib.error.URLError as e:
             raise Exception(f"Failed to download {url}: {str(e)}")
+        
+        # Verify checksum when one is configured for this file
+        expected = self.cfg.checksums.get(dest_path.name)
+        if expected:
+            sha256 = hashlib.sha256()
+            with open(dest_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    sha256.update(block)
+            if sha256.hexdigest().lower() != expected.lower():
+                raise Exception(f"Checksum mismatch for {dest_path.name}")
 
     def _add_to_path(self, path: str) -> None:
         """Add a directory to the system PATH."""
@@ -5,16 +5,87 @@ Tracks setup progress and enables resumable installation
 """
 
 import os
+import sys
 import json
+import heapq
+import atexit
 import time
 import hashlib
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass
+from contextlib import contextmanager
 from datetime import datetime
 
-@dataclass
+# orjson is optional: it serializes the progress file much faster when
+# installed, otherwise the standard library json module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    # StageStatus dataclasses are serialized natively by orjson;
+    # the json fallback converts them through to_dict
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True, default=_to_dict).encode()
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """json.dumps hook for objects that provide to_dict()."""
+    if isinstance(obj, StageStatus):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps_line(data: Any) -> bytes:
+    """Serialize data to a single compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _atomic_write(path: Path, payload: bytes, durable: bool = False):
+    """
+    Replace path with payload without ever exposing a partially written file.
+    
+    Args:
+        path: Destination file
+        payload: Bytes to write
+        durable: Sync the data to disk before the rename
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        if durable:
+            # macOS has no fdatasync
+            getattr(os, 'fdatasync', os.fsync)(f.fileno())
+    os.replace(tmp_path, path)
+
+# Statuses that make a stage eligible to run next
+_RUNNABLE_STATUSES = frozenset(("pending", "failed"))
+
+# Report icon for each stage status
+STATUS_ICONS = {
+    "completed": "✅",
+    "in_progress": "🔄",
+    "failed": "❌",
+    "pending": "⏳"
+}
+
+# Number of logged stage events between full progress snapshots
+SNAPSHOT_INTERVAL = 10
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class StageStatus:
     name: str
     status: str  # pending, in_progress, completed, failed
@@ -29,11 +100,31 @@ class StageStatus:
         if self.details is None:
             self.details = {}
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow dict of the stage fields for serialization.
+        
+        Unlike dataclasses.asdict this does not deep-copy details, which is
+        only read by the serializer.
+        """
+        return {
+            "name": self.name,
+            "status": self.status,
+            "stage_id": self.stage_id,
+            "checksum": self.checksum,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "error_message": self.error_message,
+            "details": self.details
+        }
+
 class ProgressTracker:
     def __init__(self, setup_dir: Path, config_data: Dict = None):
         self.setup_dir = setup_dir
         self.metadata_file = setup_dir / "setup_progress.json"
+        self.event_log = setup_dir / "setup_progress.log"
         self.config_data = config_data or {}
+        self._config_checksum = self._calculate_config_checksum()
         self.session_id = str(uuid.uuid4())[:8]  # unique session identifier
         
         # Define stages with unique IDs and descriptions
@@ -115,8 +206,77 @@ class ProgressTracker:
             }
         }
         
-        self.stages = list(self.stage_definitions.keys())
+        # Execution order is derived from the dependencies, and each stage's
+        # dependency IDs are resolved once for reporting
+        self.stages = self._topological_order()
+        self._dep_ids = {
+            name: tuple(self.stage_definitions[dep]["id"] for dep in stage_def["dependencies"])
+            for name, stage_def in self.stage_definitions.items()
+        }
+        
+        # Stage transitions are appended to the event log as they happen;
+        # the full progress file is only rewritten as a periodic snapshot
+        self._log_fp = None
+        self._load_state()
+        
+        # Unsaved changes are snapshotted periodically unless batched
+        self._autosave = True
+        atexit.register(self.close)
+
+    def _load_state(self):
+        """Load the progress snapshot, replay the event log and rebuild the indexes."""
+        # Identity of the snapshot this state is based on; a different file
+        # at flush time means another tracker has saved newer progress
+        self._snapshot_stamp = self._metadata_stamp()
+        self._events_since_snapshot = 0
         self.progress_data = self._load_progress()
+        self._build_indexes()
+        self._events_since_snapshot += self._replay_events()
+        self._dirty = self._events_since_snapshot > 0
+
+    def _metadata_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Return (inode, mtime, size) of the progress file, or None if it does not exist."""
+        try:
+            st = os.stat(self.metadata_file)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _topological_order(self) -> List[str]:
+        """
+        Order stages so every stage follows its dependencies (Kahn's algorithm).
+        
+        Among stages that are ready at the same time, declaration order is
+        kept, so the result matches the order of stage_definitions whenever
+        that order is already valid.
+        
+        Raises:
+            ValueError: If the stage dependencies contain a cycle
+        """
+        names = list(self.stage_definitions)
+        position = {name: i for i, name in enumerate(names)}
+        remaining = {name: len(self.stage_definitions[name]["dependencies"]) for name in names}
+        dependents = {name: [] for name in names}
+        for name in names:
+            for dep in self.stage_definitions[name]["dependencies"]:
+                dependents[dep].append(name)
+        
+        ready = [position[name] for name in names if remaining[name] == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            name = names[heapq.heappop(ready)]
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, position[dependent])
+        
+        if len(order) != len(names):
+            cyclic = sorted(set(names) - set(order))
+            raise ValueError(f"Cyclic stage dependencies: {', '.join(cyclic)}")
+        
+        return order
 
     def _load_progress(self) -> Dict[str, StageStatus]:
         """Load existing progress from metadata file."""
@@ -124,22 +284,154 @@ class ProgressTracker:
             return self._initialize_progress()
         
         try:
-            with open(self.metadata_file, 'r') as f:
-                data = json.load(f)
+            data = _loads(self.metadata_file.read_bytes())
             
-            # Convert dict back to StageStatus objects
+            # Convert dicts back to StageStatus objects positionally
+            make_stage = StageStatus
             progress = {}
-            for stage_name, stage_data in data.get('stages', {}).items():
-                progress[stage_name] = StageStatus(**stage_data)
+            for stage_name, sd in data.get('stages', {}).items():
+                progress[stage_name] = make_stage(
+                    sd["name"], sd["status"], sd["stage_id"], sd.get("checksum"),
+                    sd.get("start_time"), sd.get("end_time"), sd.get("error_message"),
+                    sd.get("details") or {}
+                )
             
             return progress
-        except (json.JSONError, KeyError, TypeError) as e:
+        except (ValueError, KeyError, TypeError) as e:
+            # ValueError covers both json and orjson decode errors
             print(f"Warning: Could not load progress file, starting fresh: {e}")
             return self._initialize_progress()
 
+    def _build_indexes(self):
+        """Build stage position, status count and cursor lookups from progress_data."""
+        self._stage_index = {name: i for i, name in enumerate(self.stages)}
+        
+        self._status_counts = {"pending": 0, "in_progress": 0, "completed": 0, "failed": 0}
+        for stage in self.progress_data.values():
+            self._status_counts[stage.status] = self._status_counts.get(stage.status, 0) + 1
+        
+        # Time spent across completed stages, kept current by _apply_event
+        self._total_time_spent = 0.0
+        for stage in self.progress_data.values():
+            if stage.status == "completed":
+                self._total_time_spent += self._stage_duration(stage)
+        
+        # First stage that is pending/failed, and first stage not completed
+        self._next_pending_idx = self._scan_forward(0, runnable=True)
+        self._resume_idx = self._scan_forward(0, runnable=False)
+
+    def _scan_forward(self, idx: int, runnable: bool) -> int:
+        """Return the first stage index at or after idx matching the cursor condition."""
+        stages = self.stages
+        progress = self.progress_data
+        while idx < len(stages):
+            status = progress[stages[idx]].status
+            if (status in _RUNNABLE_STATUSES) if runnable else (status != "completed"):
+                break
+            idx += 1
+        return idx
+
+    def _update_indexes(self, stage_name: str, old_status: str, new_status: str):
+        """Keep status counts and cursors in step with a single stage change."""
+        counts = self._status_counts
+        counts[old_status] = counts.get(old_status, 0) - 1
+        counts[new_status] = counts.get(new_status, 0) + 1
+        
+        idx = self._stage_index[stage_name]
+        if new_status in _RUNNABLE_STATUSES:
+            self._next_pending_idx = min(self._next_pending_idx, idx)
+        elif idx == self._next_pending_idx:
+            self._next_pending_idx = self._scan_forward(idx, runnable=True)
+        
+        if new_status != "completed":
+            self._resume_idx = min(self._resume_idx, idx)
+        elif idx == self._resume_idx:
+            self._resume_idx = self._scan_forward(idx, runnable=False)
+
+    def _replay_events(self) -> int:
+        """
+        Apply stage events logged since the last snapshot.
+        
+        Returns:
+            Number of events applied
+        """
+        if not self.event_log.exists():
+            return 0
+        
+        applied = 0
+        try:
+            with open(self.event_log, 'rb') as f:
+                for line in f:
+                    try:
+                        event = _loads(line)
+                    except ValueError:
+                        # Partial line left by an interrupted write
+                        continue
+                    if event.get("stage") in self.progress_data:
+                        self._apply_event(event)
+                        applied += 1
+        except OSError as e:
+            print(f"Warning: Could not read progress log: {e}")
+        
+        return applied
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply a single stage event to the in-memory progress."""
+        stage = self.progress_data[event["stage"]]
+        status = event["status"]
+        old_status = stage.status
+        if old_status == "completed":
+            self._total_time_spent -= self._stage_duration(stage)
+        stage.status = status
+        self._update_indexes(stage.name, old_status, status)
+        
+        if status == "in_progress":
+            stage.start_time = event["ts"]
+        elif status == "pending":
+            stage.start_time = None
+            stage.end_time = None
+            stage.error_message = None
+            stage.details = {}
+        else:
+            stage.end_time = event["ts"]
+            if "err" in event:
+                stage.error_message = event["err"]
+            if event.get("details"):
+                stage.details.update(event["details"])
+            if status == "completed":
+                self._total_time_spent += self._stage_duration(stage)
+
+    @staticmethod
+    def _stage_duration(stage: StageStatus) -> float:
+        """Duration of a finished stage, or 0 if it has no recorded times."""
+        if stage.start_time and stage.end_time:
+            return stage.end_time - stage.start_time
+        return 0
+
+    def _record_event(self, stage_name: str, status: str, error_message: Optional[str] = None,
+                      details: Optional[Dict[str, Any]] = None):
+        """Apply a stage transition and append it to the event log."""
+        event = {"ts": time.time(), "stage": stage_name, "status": status}
+        if error_message is not None:
+            event["err"] = error_message
+        if details:
+            event["details"] = details
+        
+        self._apply_event(event)
+        
+        try:
+            if self._log_fp is None:
+                self._log_fp = open(self.event_log, 'ab', buffering=0)
+            self._log_fp.write(_dumps_line(event))
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not log progress event: {e}")
+        
+        self._events_since_snapshot += 1
+        self._maybe_save()
+
     def _initialize_progress(self) -> Dict[str, StageStatus]:
         """Initialize progress with all stages as pending."""
-        config_checksum = self._calculate_config_checksum()
+        config_checksum = self._config_checksum
         return {
             stage_name: StageStatus(
                 name=stage_name,
@@ -160,32 +452,104 @@ class ProgressTracker:
             "user": self.config_data.get("user", {})
         }, sort_keys=True)
         
-        return hashlib.md5(config_str.encode()).hexdigest()[:12]
+        return hashlib.blake2b(config_str.encode(), digest_size=6).hexdigest()
 
-    def _save_progress(self):
-        """Save current progress to metadata file."""
+    def set_config(self, config_data: Dict):
+        """Replace the tracked configuration and refresh its checksum."""
+        self.config_data = config_data or {}
+        self._config_checksum = self._calculate_config_checksum()
+
+    def _save_progress(self, durable: bool = False) -> bool:
+        """
+        Save a snapshot of current progress to the metadata file.
+        
+        The snapshot is written to a temporary file and renamed over the
+        metadata file, so an interrupted save leaves the previous one intact.
+        
+        Args:
+            durable: Sync the snapshot to disk before renaming it into place
+        """
         try:
-            # Convert StageStatus objects to dict for JSON serialization
-            stages_data = {
-                stage_name: asdict(stage_status)
-                for stage_name, stage_status in self.progress_data.items()
-            }
-            
             metadata = {
                 "last_updated": time.time(),
                 "setup_version": "1.0.0",
                 "session_id": self.session_id,
-                "config_checksum": self._calculate_config_checksum(),
+                "config_checksum": self._config_checksum,
                 "total_stages": len(self.stages),
-                "completed_stages": len([s for s in self.progress_data.values() if s.status == "completed"]),
-                "stage_definitions": self.stage_definitions,
-                "stages": stages_data
+                "completed_stages": self._status_counts["completed"],
+                "stages": self.progress_data
             }
             
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            _atomic_write(self.metadata_file, _dumps(metadata), durable)
+            self._snapshot_stamp = self._metadata_stamp()
+            return True
         except Exception as e:
             print(f"Warning: Could not save progress: {e}")
+            return False
+
+    def _maybe_save(self):
+        """Record a pending change and snapshot it when due, unless inside a batch."""
+        self._dirty = True
+        if self._autosave and self._events_since_snapshot >= SNAPSHOT_INTERVAL:
+            self._flush()
+
+    def _flush(self, durable: bool = False):
+        """Snapshot progress if there are unsaved changes and truncate the event log."""
+        if not self._dirty:
+            return
+        
+        if self._metadata_stamp() != self._snapshot_stamp:
+            # Another tracker saved newer progress since this one loaded or
+            # saved; overwriting it would roll stages back. Its snapshot
+            # already contains the events it replayed from the log, so pick
+            # up the current state from disk instead.
+            print("Warning: Progress was saved by another tracker; reloading it instead of overwriting")
+            if self._log_fp is not None:
+                self._log_fp.close()
+                self._log_fp = None
+            self._load_state()
+            return
+        
+        if self._save_progress(durable):
+            self._dirty = False
+            self._events_since_snapshot = 0
+            # Everything in the log is now part of the snapshot
+            try:
+                if self._log_fp is not None:
+                    self._log_fp.close()
+                    self._log_fp = None
+                if self.event_log.exists():
+                    self.event_log.unlink()
+            except OSError as e:
+                print(f"Warning: Could not truncate progress log: {e}")
+
+    def close(self):
+        """Snapshot any unsaved progress to disk and close the event log."""
+        # Closed trackers no longer need the exit hook (which also kept them alive)
+        atexit.unregister(self.close)
+        self._flush(durable=True)
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several stage transitions into a single snapshot.
+        
+        Example:
+            with tracker.batch():
+                tracker.start_stage("validation")
+                tracker.complete_stage("validation")
+        """
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield self
+        finally:
+            self._autosave = previous
+            if previous:
+                self._flush()
 
     def start_stage(self, stage_name: str) -> bool:
         """Mark a stage as started."""
@@ -193,9 +557,7 @@ class ProgressTracker:
             print(f"Warning: Unknown stage '{stage_name}'")
             return False
         
-        self.progress_data[stage_name].status = "in_progress"
-        self.progress_data[stage_name].start_time = time.time()
-        self._save_progress()
+        self._record_event(stage_name, "in_progress")
         return True
 
     def complete_stage(self, stage_name: str, details: Optional[Dict[str, Any]] = None) -> bool:
@@ -204,13 +566,7 @@ class ProgressTracker:
             print(f"Warning: Unknown stage '{stage_name}'")
             return False
         
-        stage = self.progress_data[stage_name]
-        stage.status = "completed"
-        stage.end_time = time.time()
-        if details:
-            stage.details.update(details)
-        
-        self._save_progress()
+        self._record_event(stage_name, "completed", details=details)
         return True
 
     def fail_stage(self, stage_name: str, error_message: str, details: Optional[Dict[str, Any]] = None) -> bool:
@@ -219,14 +575,7 @@ class ProgressTracker:
             print(f"Warning: Unknown stage '{stage_name}'")
             return False
         
-        stage = self.progress_data[stage_name]
-        stage.status = "failed"
-        stage.end_time = time.time()
-        stage.error_message = error_message
-        if details:
-            stage.details.update(details)
-        
-        self._save_progress()
+        self._record_event(stage_name, "failed", error_message=error_message, details=details)
         return True
 
     def get_stage_status(self, stage_name: str) -> Optional[StageStatus]:
@@ -240,113 +589,108 @@ class ProgressTracker:
 
     def get_next_pending_stage(self) -> Optional[str]:
         """Get the next stage that needs to be executed."""
-        for stage_name in self.stages:
-            stage = self.progress_data[stage_name]
-            if stage.status in ["pending", "failed"]:
-                return stage_name
+        if self._next_pending_idx < len(self.stages):
+            return self.stages[self._next_pending_idx]
         return None
 
     def get_resume_point(self) -> Optional[str]:
         """Get the stage from which setup should resume."""
-        # Look for first non-completed stage
-        for stage_name in self.stages:
-            stage = self.progress_data[stage_name]
-            if stage.status != "completed":
-                return stage_name
+        # First non-completed stage
+        if self._resume_idx < len(self.stages):
+            return self.stages[self._resume_idx]
         return None
 
     def reset_from_stage(self, stage_name: str):
         """Reset all stages from the given stage onwards."""
-        found_stage = False
-        for current_stage in self.stages:
-            if current_stage == stage_name:
-                found_stage = True
-            
-            if found_stage:
-                stage = self.progress_data[current_stage]
-                stage.status = "pending"
-                stage.start_time = None
-                stage.end_time = None
-                stage.error_message = None
-                stage.details = {}
+        idx = self._stage_index.get(stage_name)
+        if idx is None:
+            print(f"Warning: Unknown stage '{stage_name}'")
+            return
         
-        self._save_progress()
+        for current_stage in self.stages[idx:]:
+            self._record_event(current_stage, "pending")
 
     def get_progress_summary(self) -> Dict[str, Any]:
         """Get a summary of the current progress."""
-        completed = [s for s in self.progress_data.values() if s.status == "completed"]
-        failed = [s for s in self.progress_data.values() if s.status == "failed"]
-        in_progress = [s for s in self.progress_data.values() if s.status == "in_progress"]
-        
-        total_time = 0
-        for stage in completed:
-            if stage.start_time and stage.end_time:
-                total_time += stage.end_time - stage.start_time
+        total_stages = len(self.stages)
+        completed = self._status_counts["completed"]
+        failed = self._status_counts["failed"]
+        in_progress = self._status_counts["in_progress"]
+
 
         return {
-            "total_stages": len(self.stages),
-            "completed": len(completed),
-            "failed": len(failed),
-            "in_progress": len(in_progress),
-            "pending": len(self.stages) - len(completed) - len(failed) - len(in_progress),
-            "completion_percentage": (len(completed) / len(self.stages)) * 100,
-            "total_time_spent": total_time,
-            "failed_stages": [s.name for s in failed],
+            "total_stages": total_stages,
+            "completed": completed,
+            "failed": failed,
+            "in_progress": in_progress,
+            "pending": total_stages - completed - failed - in_progress,
+            "completion_percentage": (completed / total_stages) * 100,
+            "total_time_spent": self._total_time_spent,
+            "failed_stages": [s.name for s in self.progress_data.values() if s.status == "failed"] if failed else [],
             "next_stage": self.get_next_pending_stage()
         }
 
     def print_progress_report(self):
         """Print a detailed progress report."""
+        # Reports are a natural checkpoint for the progress snapshot
+        self._flush()
         summary = self.get_progress_summary()
         
-        print("\n" + "="*60)
-        print("LEGION SETUP PROGRESS REPORT")
-        print("="*60)
-        print(f"Completion: {summary['completion_percentage']:.1f}% ({summary['completed']}/{summary['total_stages']} stages)")
+        # Build the whole report and emit it with a single write
+        lines = [
+            "",
+            "=" * 60,
+            "LEGION SETUP PROGRESS REPORT",
+            "=" * 60,
+            f"Completion: {summary['completion_percentage']:.1f}% ({summary['completed']}/{summary['total_stages']} stages)"
+        ]
         
         if summary['total_time_spent'] > 0:
             minutes = summary['total_time_spent'] / 60
-            print(f"Time spent: {minutes:.1f} minutes")
+            lines.append(f"Time spent: {minutes:.1f} minutes")
         
         if summary['failed'] > 0:
-            print(f"❌ Failed stages: {', '.join(summary['failed_stages'])}")
+            lines.append(f"❌ Failed stages: {', '.join(summary['failed_stages'])}")
         
         if summary['next_stage']:
-            print(f"🔄 Next stage: {summary['next_stage']}")
+            lines.append(f"🔄 Next stage: {summary['next_stage']}")
         
-        print("\nStage Details:")
-        print("-" * 40)
+        lines.append("\nStage Details:")
+        lines.append("-" * 40)
         
         for stage_name in self.stages:
             stage = self.progress_data[stage_name]
             stage_def = self.stage_definitions[stage_name]
-            icon = {
-                "completed": "✅",
-                "in_progress": "🔄", 
-                "failed": "❌",
-                "pending": "⏳"
-            }.get(stage.status, "❓")
+            icon = STATUS_ICONS.get(stage.status, "❓")
             
             duration = ""
             if stage.start_time and stage.end_time:
                 duration = f" ({(stage.end_time - stage.start_time):.1f}s)"
             
-            print(f"{icon} [{stage.stage_id}] {stage_def['description']}{duration}")
+            lines.append(f"{icon} [{stage.stage_id}] {stage_def['description']}{duration}")
             
             if stage.error_message:
-                print(f"   Error: {stage.error_message}")
+                lines.append(f"   Error: {stage.error_message}")
             
             # Show dependencies if stage is pending/failed
-            if stage.status in ["pending", "failed"] and stage_def["dependencies"]:
-                deps = [self.stage_definitions[dep]["id"] for dep in stage_def["dependencies"]]
-                print(f"   Depends on: {', '.join(deps)}")
+            deps = self._dep_ids[stage_name]
+            if deps and stage.status in _RUNNABLE_STATUSES:
+                lines.append(f"   Depends on: {', '.join(deps)}")
         
-        print("="*60)
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def cleanup_metadata(self):
-        """Remove the progress metadata file."""
-        if self.metadata_file.exists():
-            self.metadata_file.unlink()
+        """Remove the progress metadata and event log files."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+        self._dirty = False
+        for path in (self.metadata_file, self.event_log):
+            if path.exists():
+                path.unlink()
+        self._snapshot_stamp = None
 
     def should_skip_stage(self, stage_name: str, force_reinstall: bool = False) -> bool:
         """Determine if a stage should be skipped based on current status."""
@@ -4,28 +4,315 @@ Legion Setup - Validation and Verification Module
 Comprehensive validation of the Legion development environment
 """
 
+import io
 import os
+import re
+import string
 import sys
+import shutil
 import subprocess
 import platform
 import time
+import errno
+import hashlib
+import socket
+import struct
+import selectors
+import threading
+import concurrent.futures
 import urllib.request
 import urllib.error
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
+from functools import lru_cache
 import json
 import yaml
 
+# packaging is optional: it also understands pre-release and local version
+# suffixes; without it versions are compared as integer tuples
+try:
+    from packaging.version import Version, InvalidVersion
+except ImportError:
+    Version = None
+
+# orjson is optional: it serializes the JSON report much faster when
+# installed, otherwise the standard library json module is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional: it is only needed for the compressed 'json.zst'
+# report format
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Version patterns tried in order by _extract_version, compiled once so
+# parallel version probes share them
+_VERSION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d+\.\d+\.\d+)',
+    r'version "(\d+\.\d+\.\d+)',
+    r'v(\d+\.\d+\.\d+)',
+    r'(\d+\.\d+)',
+))
+
+# SO_LINGER with a zero timeout: close() resets the connection instead of
+# leaving the probe socket in TIME_WAIT
+_LINGER_ABORT = struct.pack('ii', 1, 0)
+
+# Validation tests disabled by a setup_options flag, with the message
+# recorded in place of running them. Only flags that mean "don't check
+# this" belong here: skip_docker_setup only skips configuring Docker, so
+# Docker Services is still verified.
+_CONFIG_SKIPS = {
+    "IDE Integration": ('skip_intellij_setup', 'IntelliJ setup was skipped per configuration')
+}
+
+# Software (as named in the Software Versions results) each validation test
+# needs; when any of it is missing the test is skipped as certain to fail
+TEST_DEPS = {
+    "Database Connectivity": {'mysql'},
+    "Docker Services": {'docker'}
+}
+
+# Every local port probed by the docker, network and port availability
+# validations; probed together once per validation run
+_SERVICE_PORT_TARGETS = tuple(('localhost', port) for port in (8080, 3306, 9200, 6379, 6380))
+
+def _find_version_line(raw_lines: List[bytes]) -> Optional[str]:
+    """Return the first of raw_lines (decoded and stripped) that contains a version, if any."""
+    for raw in raw_lines:
+        line = raw.decode('utf-8', errors='replace').strip()
+        if any(pattern.search(line) for pattern in _VERSION_PATTERNS):
+            return line
+    return None
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str):
+    """
+    Parse a version string into a comparable key, or None if unparseable.
+    
+    Trailing zero components are dropped from integer tuples so that
+    "17" and "17.0.0" compare equal.
+    """
+    if Version is not None:
+        try:
+            return Version(version)
+        except InvalidVersion:
+            return None
+    try:
+        parts = [int(part) for part in version.split('.')]
+    except ValueError:
+        return None
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+# Validation results reused across runs. Only passing results of tests whose
+# inputs are covered by the environment fingerprint (platform, PATH contents,
+# tool homes and resolved tools, config) are cached; service, network and
+# file checks always run.
+VALIDATION_CACHE_FILE = Path.home() / '.cache' / 'legion-setup' / 'validation_cache.json'
+VALIDATION_CACHE_TTL = 15 * 60  # seconds
+CACHEABLE_TESTS = frozenset({"Software Versions"})
+
+# Environment variables that select tool installations without touching PATH;
+# part of the validation cache fingerprint
+_TOOL_HOME_VARS = ('JAVA_HOME', 'M2_HOME', 'MAVEN_HOME')
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _to_jsonable(obj: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Convert obj to plain JSON types, stringifying anything else like
+    default=str would.
+    
+    Shared subtrees are converted once (memoized by id()), and the result
+    can be encoded without a default callback.
+    """
+    if isinstance(obj, _JSON_SCALARS):
+        return obj
+    key = id(obj)
+    if key in memo:
+        return memo[key]
+    if isinstance(obj, dict):
+        converted = memo[key] = {
+            k if isinstance(k, _JSON_SCALARS) else str(k): _to_jsonable(v, memo)
+            for k, v in obj.items()
+        }
+    elif isinstance(obj, (list, tuple)):
+        converted = memo[key] = [_to_jsonable(item, memo) for item in obj]
+    else:
+        converted = memo[key] = str(obj)
+    return converted
+
+# Fixed header of the text validation report
+_REPORT_HEADER_TEMPLATE = string.Template("""\
+╔══════════════════════════════════════════════════════════════╗
+║              ENVIRONMENT VALIDATION REPORT                  ║
+╚══════════════════════════════════════════════════════════════╝
+
+Overall Status: ${overall_status}
+Validation Time: ${validation_time}
+
+""")
+
+# Summary entries run_comprehensive_validation adds next to the test results
+_SUMMARY_KEYS = frozenset(('overall_success', 'validation_timestamp'))
+
+# Report status markers indexed by bool(status): failure first, success second
+_ICON = ("❌", "✅")
+_TEST_STATUS = ("❌ FAIL", "✅ PASS")
+
+# Keys that carry the status of a report detail dict, in priority order
+_STATUS_KEYS = ('success', 'accessible', 'connected')
+
+def _detail_ok(detail: Dict[str, Any]) -> bool:
+    """
+    Status of a report detail dict: 'success', else 'accessible', else
+    'connected' (first key present wins).
+    """
+    for key in _STATUS_KEYS:
+        if key in detail:
+            return bool(detail[key])
+    return False
+
+def _render_subvalue(subvalue: Dict[str, Any], memo: Dict[int, Tuple[str, str]]) -> Tuple[str, str]:
+    """
+    Render the status icon and message of a report detail dict.
+    
+    Validators often share one status dict across many checks, so renders
+    are memoized by id(); results are not mutated while a report is built.
+    """
+    key = id(subvalue)
+    rendered = memo.get(key)
+    if rendered is None:
+        status_icon = _ICON[_detail_ok(subvalue)]
+        # Only stringify the whole dict when it has no message
+        message = subvalue['message'] if 'message' in subvalue else str(subvalue)
+        rendered = memo[key] = (status_icon, message)
+    return rendered
+
+def _render_detail(value: Dict[str, Any], memo: Dict[int, str],
+                   sub_memo: Dict[int, Tuple[str, str]]) -> str:
+    """Render the indented lines of a nested report detail dict, memoized by id()."""
+    key = id(value)
+    rendered = memo.get(key)
+    if rendered is None:
+        lines = []
+        for subkey, subvalue in value.items():
+            if isinstance(subvalue, dict):
+                status_icon, message = _render_subvalue(subvalue, sub_memo)
+                lines.append(f"    {status_icon} {subkey}: {message}\n")
+            else:
+                lines.append(f"    - {subkey}: {subvalue}\n")
+        rendered = memo[key] = ''.join(lines)
+    return rendered
+
+# Formats written by save_validation_report unless told otherwise; the
+# zstd-compressed 'json.zst' format is opt-in
+REPORT_FORMATS = frozenset(('text', 'json'))
+_KNOWN_REPORT_FORMATS = REPORT_FORMATS | {'json.zst'}
+
+# zstd level for the compressed JSON report; low levels already shrink the
+# repetitive report several times over
+_REPORT_ZSTD_LEVEL = 3
+
+# Where save_validation_report puts reports when no path is given
+_DEFAULT_LOGS_DIR = Path.home() / '.legion_setup' / 'logs'
+
+@lru_cache(maxsize=1)
+def _ensure_logs_dir() -> Path:
+    """Create the default report directory once per process and return it."""
+    _DEFAULT_LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    return _DEFAULT_LOGS_DIR
+
+# Write buffer for the streamed JSON report; coalesces the many small
+# iterencode chunks into a few large writes
+_REPORT_WRITE_BUFFER = 1 << 20
+
+def _write_report_json(results: Dict[str, Any], json_path: Path):
+    """
+    Write validation results as indented JSON, using orjson when available.
+    
+    The file is written next to json_path and renamed into place, so readers
+    never see a partial report.
+    """
+    tmp_path = json_path.with_name(json_path.name + '.tmp')
+    if orjson is not None:
+        # Port numbers and similar non-string keys are stringified like json does
+        payload = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+    else:
+        # Stream the encoder output instead of building the whole document first
+        encoder = json.JSONEncoder(indent=2, default=str)
+        with open(tmp_path, 'w', buffering=_REPORT_WRITE_BUFFER) as f:
+            f.writelines(encoder.iterencode(results))
+    os.replace(tmp_path, json_path)
+
+def _write_report_json_zst(results: Dict[str, Any], zst_path: Path):
+    """Write validation results as zstd-compressed indented JSON (requires zstandard)."""
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    else:
+        data = json.dumps(results, indent=2, default=str).encode()
+    payload = zstandard.ZstdCompressor(level=_REPORT_ZSTD_LEVEL).compress(data)
+    
+    tmp_path = zst_path.with_name(zst_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, zst_path)
+
+class _LazyReport:
+    """Renders the text validation report only when converted to a string."""
+    
+    def __init__(self, validator: 'EnvironmentValidator', results: Dict[str, Any]):
+        self.validator = validator
+        self.results = results
+    
+    def __str__(self) -> str:
+        return self.validator.generate_validation_report(self.results)
+
 class EnvironmentValidator:
     def __init__(self, config: Dict, logger):
         self.config = config
         self.logger = logger
         self.platform = platform.system().lower()
         self.validation_results = {}
+        # Snapshot PATH and resolve the tools the validators look for once
+        self._path_dirs = os.environ.get('PATH', '').split(os.pathsep)
+        self._resolved_tools = {
+            tool: shutil.which(tool)
+            for tool in ('java', 'mvn', 'node', 'npm', 'mysql', 'docker', 'git', 'yasha')
+        }
+        # Serializes log output from validation tests running in parallel
+        self._log_lock = threading.Lock()
+        # --no-cache on the command line sets advanced.no_validation_cache
+        self.use_cache = not self.config.get('advanced', {}).get('no_validation_cache', False)
+        # Names from a single `docker ps`, shared by container checks in a run
+        self._running_containers = None
+        # Port probe results shared by the validations in a run
+        self._port_results = None
+        self._port_lock = threading.Lock()
         
     def run_comprehensive_validation(self) -> Dict[str, Any]:
-        """Run comprehensive validation of the entire environment."""
+        """
+        Run comprehensive validation of the entire environment.
+        
+        The validation tests are independent and mostly wait on subprocesses,
+        sockets and HTTP requests, so they run concurrently in a thread pool.
+        Set LEGION_SETUP_SERIAL=1 to run them one after another when debugging.
+        
+        Results of CACHEABLE_TESTS from a run within VALIDATION_CACHE_TTL are
+        reused while the environment fingerprint is unchanged. Tests listed in
+        TEST_DEPS are skipped when their required software is not installed.
+        """
         self.logger.info("🔍 Running comprehensive environment validation...")
+        self._running_containers = None
+        self._port_results = None
         
         validation_tests = [
             ("Software Versions", self._validate_software_versions),
@@ -40,39 +327,228 @@ class EnvironmentValidator:
             ("IDE Integration", self._validate_ide_integration)
         ]
         
-        results = {}
-        overall_success = True
-        
-        for test_name, test_func in validation_tests:
-            self.logger.info(f"Running {test_name} validation...")
-            try:
-                success, details = test_func()
-                results[test_name] = {
-                    'success': success,
-                    'details': details,
+        fingerprint = None
+        cached = {}
+        if self.use_cache:
+            fingerprint = self._environment_fingerprint()
+            cached = self._load_cached_results(fingerprint)
+        
+        outcomes = {}
+        setup_options = self.config.get('setup_options', {})
+        for test_name, _ in validation_tests:
+            option, message = _CONFIG_SKIPS.get(test_name, (None, None))
+            if option and setup_options.get(option, False):
+                # Opted out in the configuration, so don't run the probes at all
+                outcomes[test_name] = {
+                    'success': True,
+                    'details': {'status': 'skipped', 'message': message},
                     'timestamp': time.time()
                 }
+                self.logger.info(f"⏭️  {test_name}: SKIPPED")
+            elif test_name in cached:
+                outcomes[test_name] = cached[test_name]
+                self.logger.info(f"{'✅' if cached[test_name]['success'] else '❌'} {test_name}: reused cached result")
+        pending_tests = [(name, func) for name, func in validation_tests if name not in outcomes]
+        
+        # Tests with software prerequisites wait for the Software Versions
+        # result; everything else starts straight away
+        gated_tests = [(name, func) for name, func in pending_tests if name in TEST_DEPS]
+        ungated_tests = [(name, func) for name, func in pending_tests if name not in TEST_DEPS]
+        
+        if os.environ.get('LEGION_SETUP_SERIAL'):
+            for test_name, test_func in ungated_tests:
+                outcomes[test_name] = self._run_validation_test(test_name, test_func)
+            
+            missing_software = self._missing_software(outcomes.get("Software Versions"))
+            for test_name, test_func in gated_tests:
+                outcomes[test_name] = (self._precondition_result(test_name, missing_software)
+                                       or self._run_validation_test(test_name, test_func))
+        elif pending_tests:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending_tests)) as executor:
+                futures = {
+                    executor.submit(self._run_validation_test, test_name, test_func): test_name
+                    for test_name, test_func in ungated_tests
+                }
                 
-                if success:
-                    self.logger.info(f"✅ {test_name}: PASSED")
-                else:
-                    self.logger.error(f"❌ {test_name}: FAILED - {details.get('message', 'Unknown error')}")
-                    overall_success = False
+                if gated_tests:
+                    software_future = next(
+                        (future for future, name in futures.items() if name == "Software Versions"), None
+                    )
+                    software_outcome = software_future.result() if software_future else outcomes.get("Software Versions")
+                    missing_software = self._missing_software(software_outcome)
                     
-            except Exception as e:
-                self.logger.error(f"❌ {test_name}: ERROR - {str(e)}")
-                results[test_name] = {
-                    'success': False,
-                    'details': {'message': f"Validation error: {str(e)}"},
-                    'timestamp': time.time()
-                }
-                overall_success = False
+                    for test_name, test_func in gated_tests:
+                        skipped = self._precondition_result(test_name, missing_software)
+                        if skipped:
+                            outcomes[test_name] = skipped
+                        else:
+                            futures[executor.submit(self._run_validation_test, test_name, test_func)] = test_name
+                
+                for future in concurrent.futures.as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+        
+        if self.use_cache and any(name in CACHEABLE_TESTS for name, _ in pending_tests):
+            self._save_cached_results(fingerprint, outcomes)
+        
+        # Keep the declared test order in the results regardless of completion order
+        results = {test_name: outcomes[test_name] for test_name, _ in validation_tests}
+        overall_success = all(result['success'] for result in results.values())
         
         results['overall_success'] = overall_success
         results['validation_timestamp'] = time.time()
         
+        # Full report in verbose logs; only rendered if DEBUG is enabled
+        self.logger.debug("%s", _LazyReport(self, results))
+        
         return results
 
+    def _missing_software(self, software_outcome: Optional[Dict[str, Any]]) -> Set[str]:
+        """Names reported as not installed by a Software Versions result."""
+        if not software_outcome:
+            return set()
+        versions = software_outcome.get('details', {}).get('software_versions', {})
+        return {name for name, result in versions.items() if not result.get('installed')}
+
+    def _precondition_result(self, test_name: str, missing_software: Set[str]) -> Optional[Dict[str, Any]]:
+        """
+        Build a skipped result if a test's required software is missing.
+        
+        Returns:
+            Failed 'skipped-precondition' result, or None if the test should run
+        """
+        missing = sorted(TEST_DEPS.get(test_name, set()) & missing_software)
+        if not missing:
+            return None
+        
+        message = f"Skipped: required software not installed: {', '.join(missing)}"
+        with self._log_lock:
+            self.logger.error(f"❌ {test_name}: {message}")
+        return {
+            'success': False,
+            'details': {'status': 'skipped-precondition', 'message': message},
+            'timestamp': time.time()
+        }
+
+    def _environment_fingerprint(self) -> str:
+        """
+        Fingerprint the inputs of the cacheable validation tests.
+        
+        Installing or upgrading a tool changes the modification time of its
+        PATH directory, which invalidates the cached results. Installs that
+        leave PATH directories untouched (a JDK package behind a symlink,
+        update-alternatives, a new JAVA_HOME) are caught by the tool homes
+        and by the real path and modification time of each resolved tool.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(platform.platform().encode())
+        hasher.update(sys.executable.encode())
+        
+        for directory in self._path_dirs:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = 0
+            hasher.update(f"{directory}:{mtime}\n".encode())
+        
+        for variable in _TOOL_HOME_VARS:
+            hasher.update(f"{variable}={os.environ.get(variable, '')}\n".encode())
+        
+        for tool, path in sorted(self._resolved_tools.items()):
+            if path is None:
+                hasher.update(f"{tool}:-\n".encode())
+                continue
+            real_path = os.path.realpath(path)
+            try:
+                mtime = os.stat(real_path).st_mtime_ns
+            except OSError:
+                mtime = 0
+            hasher.update(f"{tool}:{real_path}:{mtime}\n".encode())
+        
+        hasher.update(json.dumps(self.config, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    def _load_cached_results(self, fingerprint: str) -> Dict[str, Any]:
+        """
+        Load unexpired cached test results for the given fingerprint.
+        
+        Returns:
+            Dict mapping test name to its cached result (empty if none)
+        """
+        try:
+            with open(VALIDATION_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        entries = cache.get(fingerprint, {}) if isinstance(cache, dict) else {}
+        now = time.time()
+        return {
+            test_name: result
+            for test_name, result in entries.items()
+            if test_name in CACHEABLE_TESTS and result.get('success')
+            and now - result.get('timestamp', 0) < VALIDATION_CACHE_TTL
+        }
+
+    def _save_cached_results(self, fingerprint: str, outcomes: Dict[str, Any]):
+        """
+        Persist passing cacheable test results, replacing the cache file atomically.
+        
+        Failures are never cached, so a fix is picked up on the next run.
+        """
+        entries = {
+            name: result for name, result in outcomes.items()
+            if name in CACHEABLE_TESTS and result.get('success')
+        }
+        tmp_path = VALIDATION_CACHE_FILE.with_suffix('.json.tmp')
+        
+        try:
+            VALIDATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # json.dump always uses the pure-Python encoder; a one-shot
+            # dumps of the sanitized tree goes through the C encoder
+            payload = json.dumps(_to_jsonable({fingerprint: entries}, {}))
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, VALIDATION_CACHE_FILE)
+        except OSError as e:
+            self.logger.debug(f"Could not save validation cache: {e}")
+
+    def _run_validation_test(self, test_name: str, test_func) -> Dict[str, Any]:
+        """
+        Run a single validation test and log its outcome.
+        
+        Args:
+            test_name: Display name of the test
+            test_func: Callable returning (success, details)
+            
+        Returns:
+            Result dict with success, details and timestamp
+        """
+        with self._log_lock:
+            self.logger.info(f"Running {test_name} validation...")
+        try:
+            success, details = test_func()
+            
+            with self._log_lock:
+                if success:
+                    self.logger.info(f"✅ {test_name}: PASSED")
+                else:
+                    self.logger.error(f"❌ {test_name}: FAILED - {details.get('message', 'Unknown error')}")
+            
+            return {
+                'success': success,
+                'details': details,
+                'timestamp': time.time()
+            }
+                
+        except Exception as e:
+            with self._log_lock:
+                self.logger.error(f"❌ {test_name}: ERROR - {str(e)}")
+            return {
+                'success': False,
+                'details': {'message': f"Validation error: {str(e)}"},
+                'timestamp': time.time()
+            }
+
     def _validate_software_versions(self) -> Tuple[bool, Dict[str, Any]]:
         """Validate that all required software is installed with correct versions."""
         required_software = {
@@ -87,74 +563,82 @@ class EnvironmentValidator:
             'yasha': {'min_version': '1.0.0', 'command': ['yasha', '--version']}
         }
         
-        results = {}
-        all_passed = True
+        # Each probe spawns a subprocess, so run them all at once
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(required_software)) as executor:
+            results = dict(executor.map(self._probe_one, required_software.keys(), required_software.values()))
         
-        for software, requirements in required_software.items():
-            try:
-                result = subprocess.run(
-                    requirements['command'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                if result.returncode == 0:
-                    version_output = result.stdout or result.stderr
-                    version = self._extract_version(version_output)
-                    
-                    # Check version requirements
-                    version_ok = True
-                    version_message = f"Found version: {version}"
-                    
-                    if 'min_version' in requirements:
-                        if self._version_compare(version, requirements['min_version']) < 0:
-                            version_ok = False
-                            version_message = f"Version {version} is below minimum {requirements['min_version']}"
-                    
-                    elif 'expected_version' in requirements:
-                        expected = requirements['expected_version']
-                        if not version.startswith(expected.split('.')[0]):  # Major version match
-                            version_ok = False
-                            version_message = f"Version {version} does not match expected {expected}"
-                    
-                    results[software] = {
+        all_passed = all(result['version_ok'] for result in results.values())
+        
+        return all_passed, {'software_versions': results}
+
+    def _probe_one(self, software: str, requirements: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run a single software version probe.
+        
+        Args:
+            software: Name of the software being checked
+            requirements: Dict with 'command' and 'min_version' or 'expected_version'
+            
+        Returns:
+            Tuple of (software, result dict)
+        """
+        try:
+            returncode, version_output = self._version_line_from(requirements['command'], timeout=10)
+            
+            if returncode == 0:
+                version = self._extract_version(version_output)
+                if version is None:
+                    return software, {
                         'installed': True,
-                        'version': version,
-                        'version_ok': version_ok,
-                        'message': version_message
-                    }
-                    
-                    if not version_ok:
-                        all_passed = False
-                else:
-                    results[software] = {
-                        'installed': False,
                         'version': None,
                         'version_ok': False,
-                        'message': f"Command failed: {result.stderr}"
+                        'message': f"Could not determine version from: {version_output}"
                     }
-                    all_passed = False
-                    
-            except subprocess.TimeoutExpired:
-                results[software] = {
-                    'installed': False,
-                    'version': None,
-                    'version_ok': False,
-                    'message': "Version check timed out"
-                }
-                all_passed = False
                 
-            except FileNotFoundError:
-                results[software] = {
+                # Check version requirements
+                version_ok = True
+                version_message = f"Found version: {version}"
+                
+                if 'min_version' in requirements:
+                    if self._version_compare(version, requirements['min_version']) < 0:
+                        version_ok = False
+                        version_message = f"Version {version} is below minimum {requirements['min_version']}"
+                
+                elif 'expected_version' in requirements:
+                    expected = requirements['expected_version']
+                    if not version.startswith(expected.split('.')[0]):  # Major version match
+                        version_ok = False
+                        version_message = f"Version {version} does not match expected {expected}"
+                
+                return software, {
+                    'installed': True,
+                    'version': version,
+                    'version_ok': version_ok,
+                    'message': version_message
+                }
+            else:
+                return software, {
                     'installed': False,
                     'version': None,
                     'version_ok': False,
-                    'message': "Software not found in PATH"
+                    'message': f"Command failed: {version_output}"
                 }
-                all_passed = False
-        
-        return all_passed, {'software_versions': results}
+                
+        except subprocess.TimeoutExpired:
+            return software, {
+                'installed': False,
+                'version': None,
+                'version_ok': False,
+                'message': "Version check timed out"
+            }
+            
+        except FileNotFoundError:
+            return software, {
+                'installed': False,
+                'version': None,
+                'version_ok': False,
+                'message': "Software not found in PATH"
+            }
 
     def _validate_database_connectivity(self) -> Tuple[bool, Dict[str, Any]]:
         """Validate database connectivity and setup."""
@@ -174,47 +658,48 @@ class EnvironmentValidator:
         database_results = {}
         
         try:
-            import mysql.connector
             from mysql.connector import Error
+            from mysql.connector.pooling import MySQLConnectionPool
             
             legion_password = self.config.get('database', {}).get('legion_db_password', 'legionwork')
             
-            for database in databases_to_test:
+            # One pool serves every database probe, so the probes share
+            # connections and can run concurrently
+            pool_config = {
+                'pool_name': 'legion_validator',
+                'pool_size': len(databases_to_test),
+                'host': 'localhost',
+                'user': 'legion',
+                'password': legion_password,
+                'connection_timeout': 10
+            }
+            try:
                 try:
-                    connection = mysql.connector.connect(
-                        host='localhost',
-                        user='legion',
-                        password=legion_password,
-                        database=database,
-                        connection_timeout=10
-                    )
-                    
-                    cursor = connection.cursor()
-                    
-                    # Count tables
-                    cursor.execute("SHOW TABLES")
-                    table_count = len(cursor.fetchall())
-                    
-                    # Test basic query
-                    cursor.execute("SELECT 1")
-                    cursor.fetchone()
-                    
-                    database_results[database] = {
-                        'connected': True,
-                        'table_count': table_count,
-                        'message': f"Connected successfully, {table_count} tables found"
-                    }
-                    
-                    cursor.close()
-                    connection.close()
-                    
-                except Error as e:
+                    # Prefer the C extension for a faster handshake and queries
+                    pool = MySQLConnectionPool(use_pure=False, **pool_config)
+                except ImportError:
+                    with self._log_lock:
+                        self.logger.warning(
+                            "MySQL C extension not available, using the pure Python protocol. "
+                            "Install mysql-connector-python with its C extension for faster checks."
+                        )
+                    pool = MySQLConnectionPool(use_pure=True, **pool_config)
+            except Error as e:
+                for database in databases_to_test:
                     database_results[database] = {
                         'connected': False,
                         'table_count': 0,
                         'message': f"Connection failed: {str(e)}"
                     }
-                    all_passed = False
+                pool = None
+            
+            if pool is not None:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(databases_to_test)) as executor:
+                    probes = executor.map(lambda database: self._probe_database(pool, database), databases_to_test)
+                    database_results.update(zip(databases_to_test, probes))
+            
+            if not all(result['connected'] for result in database_results.values()):
+                all_passed = False
                     
         except ImportError:
             database_results['error'] = "mysql-connector-python not installed"
@@ -223,6 +708,53 @@ class EnvironmentValidator:
         results['database_connections'] = database_results
         return all_passed, results
 
+    def _probe_database(self, pool, database: str) -> Dict[str, Any]:
+        """
+        Connect to a database through the pool and count its tables.
+        
+        Args:
+            pool: MySQLConnectionPool to borrow a connection from
+            database: Database name to check
+            
+        Returns:
+            Result dict with connected, table_count and message
+        """
+        from mysql.connector import Error
+        
+        try:
+            connection = pool.get_connection()
+            try:
+                # Pooled connections only proxy method calls, so switch the
+                # default database with COM_INIT_DB directly
+                connection.cmd_init_db(database)
+                cursor = connection.cursor()
+                
+                # Count tables server-side; a successful query also proves
+                # the connection works
+                cursor.execute(
+                    "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s",
+                    (database,)
+                )
+                (table_count,) = cursor.fetchone()
+                
+                cursor.close()
+            finally:
+                # Returns the connection to the pool
+                connection.close()
+            
+            return {
+                'connected': True,
+                'table_count': table_count,
+                'message': f"Connected successfully, {table_count} tables found"
+            }
+            
+        except Error as e:
+            return {
+                'connected': False,
+                'table_count': 0,
+                'message': f"Connection failed: {str(e)}"
+            }
+
     def _validate_docker_services(self) -> Tuple[bool, Dict[str, Any]]:
         """Validate Docker services are running correctly."""
         results = {}
@@ -264,12 +796,13 @@ class EnvironmentValidator:
         
         container_results = {}
         
+        # Check if services are responding on their expected ports
+        port_status = self._port_status([('localhost', port) for port in required_containers.values()])
+        
         for container, port in required_containers.items():
             # Check if container exists and is running
             container_status = self._check_docker_container(container)
-            
-            # Check if service is responding on expected port
-            port_accessible = self._test_port_connectivity('localhost', port)
+            port_accessible = port_status[('localhost', port)]
             
             container_results[container] = {
                 'container_running': container_status,
@@ -297,27 +830,17 @@ class EnvironmentValidator:
             'https://hub.docker.com'
         ]
         
-        external_results = {}
-        for url in external_urls:
-            try:
-                response = urllib.request.urlopen(url, timeout=10)
-                accessible = response.getcode() == 200
-                external_results[url] = {
-                    'accessible': accessible,
-                    'status_code': response.getcode() if accessible else None,
-                    'message': f"HTTP {response.getcode()}" if accessible else "Not accessible"
-                }
-                
-                if not accessible:
-                    all_passed = False
-                    
-            except urllib.error.URLError as e:
-                external_results[url] = {
-                    'accessible': False,
-                    'status_code': None,
-                    'message': f"Error: {str(e)}"
-                }
-                all_passed = False
+        # Probe all URLs at once so one slow host does not delay the others
+        probed = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(external_urls)) as executor:
+            futures = [executor.submit(self._probe_url, url) for url in external_urls]
+            for future in concurrent.futures.as_completed(futures):
+                url, url_result = future.result()
+                probed[url] = url_result
+        
+        external_results = {url: probed[url] for url in external_urls}
+        if not all(url_result['accessible'] for url_result in external_results.values()):
+            all_passed = False
         
         results['external_connectivity'] = external_results
         
@@ -330,8 +853,9 @@ class EnvironmentValidator:
         }
         
         local_results = {}
+        port_status = self._port_status(list(local_services.values()))
         for service, (host, port) in local_services.items():
-            accessible = self._test_port_connectivity(host, port)
+            accessible = port_status[(host, port)]
             local_results[service] = {
                 'accessible': accessible,
                 'host': host,
@@ -346,6 +870,44 @@ class EnvironmentValidator:
         results['local_services'] = local_results
         return all_passed, results
 
+    def _probe_url(self, url: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Check that a URL responds with HTTP 200.
+        
+        A HEAD request is used so no response body is transferred; servers
+        that reject HEAD are retried with GET.
+        
+        Args:
+            url: URL to probe
+            
+        Returns:
+            Tuple of (url, result dict)
+        """
+        try:
+            try:
+                request = urllib.request.Request(url, method='HEAD')
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    status_code = response.getcode()
+            except urllib.error.HTTPError as e:
+                if e.code not in (405, 501):
+                    raise
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    status_code = response.getcode()
+            
+            accessible = status_code == 200
+            return url, {
+                'accessible': accessible,
+                'status_code': status_code if accessible else None,
+                'message': f"HTTP {status_code}" if accessible else "Not accessible"
+            }
+            
+        except urllib.error.URLError as e:
+            return url, {
+                'accessible': False,
+                'status_code': None,
+                'message': f"Error: {str(e)}"
+            }
+
     def _validate_file_permissions(self) -> Tuple[bool, Dict[str, Any]]:
         """Validate file system permissions for required directories."""
         results = {}
@@ -363,11 +925,8 @@ class EnvironmentValidator:
         permission_results = {}
         
         for directory in directories_to_check:
-            if os.path.exists(directory):
-                readable = os.access(directory, os.R_OK)
-                writable = os.access(directory, os.W_OK)
-                executable = os.access(directory, os.X_OK)
-                
+            exists, readable, writable, executable = self._probe_path(directory)
+            if exists:
                 permission_results[directory] = {
                     'exists': True,
                     'readable': readable,
@@ -394,17 +953,13 @@ class EnvironmentValidator:
         
         results['directory_permissions'] = permission_results
         
-        # Check important files
-        important_files = []
-        
-        maven_settings = Path.home() / '.m2' / 'settings.xml'
-        if maven_settings.exists():
-            important_files.append(str(maven_settings))
+        # Check important files (only reported when present)
+        important_files = [str(Path.home() / '.m2' / 'settings.xml')]
         
         file_results = {}
         for file_path in important_files:
-            if os.path.exists(file_path):
-                readable = os.access(file_path, os.R_OK)
+            readable = os.access(file_path, os.R_OK)
+            if readable or os.path.exists(file_path):
                 file_results[file_path] = {
                     'exists': True,
                     'readable': readable,
@@ -413,16 +968,26 @@ class EnvironmentValidator:
                 
                 if not readable:
                     all_passed = False
-            else:
-                file_results[file_path] = {
-                    'exists': False,
-                    'readable': False,
-                    'message': "File does not exist"
-                }
         
         results['file_permissions'] = file_results
         return all_passed, results
 
+    def _probe_path(self, path: str) -> Tuple[bool, bool, bool, bool]:
+        """
+        Check existence and read/write/execute access for a path.
+        
+        The common fully-accessible case costs a single access() call; the
+        individual permissions are only checked when that fails.
+        
+        Returns:
+            Tuple of (exists, readable, writable, executable)
+        """
+        if os.access(path, os.R_OK | os.W_OK | os.X_OK):
+            return True, True, True, True
+        if not os.path.exists(path):
+            return False, False, False, False
+        return True, os.access(path, os.R_OK), os.access(path, os.W_OK), os.access(path, os.X_OK)
+
     def _validate_environment_variables(self) -> Tuple[bool, Dict[str, Any]]:
         """Validate required environment variables."""
         results = {}
@@ -447,7 +1012,7 @@ class EnvironmentValidator:
                 all_passed = False
         else:
             # Check if Java is in PATH
-            if self._command_exists('java'):
+            if self._resolved_tools['java'] is not None:
                 results['JAVA_HOME']['message'] = "JAVA_HOME not set but Java found in PATH"
                 results['JAVA_HOME']['valid'] = True
             else:
@@ -455,12 +1020,11 @@ class EnvironmentValidator:
                 all_passed = False
         
         # Check PATH contains required tools
-        path_dirs = os.environ.get('PATH', '').split(os.pathsep)
         required_tools = ['java', 'mvn', 'node', 'npm', 'mysql', 'docker']
         
         path_results = {}
         for tool in required_tools:
-            found_in_path = self._command_exists(tool)
+            found_in_path = self._resolved_tools.get(tool) is not None
             path_results[tool] = {
                 'in_path': found_in_path,
                 'message': f"{'Found' if found_in_path else 'Not found'} in PATH"
@@ -499,9 +1063,14 @@ class EnvironmentValidator:
         
         port_results = {}
         
+        # Probe every port in one batch
+        port_status = self._port_status(
+            [('localhost', port) for port in available_ports + list(required_ports)]
+        )
+        
         # Check available ports
         for port in available_ports:
-            in_use = self._is_port_in_use(port)
+            in_use = port_status[('localhost', port)]
             port_results[port] = {
                 'port': port,
                 'should_be_free': True,
@@ -515,7 +1084,7 @@ class EnvironmentValidator:
         
         # Check required ports
         for port, service in required_ports.items():
-            in_use = self._is_port_in_use(port)
+            in_use = port_status[('localhost', port)]
             port_results[port] = {
                 'port': port,
                 'should_be_free': False,
@@ -619,15 +1188,12 @@ class EnvironmentValidator:
             results['message'] = 'IntelliJ setup was skipped per configuration'
             return True, results
         
-        # Check for IntelliJ installation
-        intellij_paths = [
-            '/Applications/IntelliJ IDEA CE.app',
-            '/Applications/IntelliJ IDEA.app',
-            Path.home() / 'Applications' / 'IntelliJ IDEA CE.app',
-            Path.home() / 'Applications' / 'IntelliJ IDEA.app'
-        ]
-        
-        intellij_found = any(Path(path).exists() for path in intellij_paths)
+        # Check for IntelliJ installation; one directory scan per location
+        # also picks up other editions such as "IntelliJ IDEA Ultimate.app"
+        intellij_found = any(
+            any(app_dir.glob('IntelliJ IDEA*.app'))
+            for app_dir in (Path('/Applications'), Path.home() / 'Applications')
+        )
         
         results['intellij_installed'] = {
             'found': intellij_found,
@@ -642,65 +1208,111 @@ class EnvironmentValidator:
 
     # Helper methods
     
-    def _extract_version(self, version_output: str) -> str:
-        """Extract version number from command output."""
-        import re
-        
-        # Common version patterns
-        patterns = [
-            r'(\d+\.\d+\.\d+)',
-            r'version "(\d+\.\d+\.\d+)',
-            r'v(\d+\.\d+\.\d+)',
-            r'(\d+\.\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, version_output)
+    def _extract_version(self, version_output: str) -> Optional[str]:
+        """Extract version number from command output, or None if it has none."""
+        for pattern in _VERSION_PATTERNS:
+            match = pattern.search(version_output)
             if match:
                 return match.group(1)
         
-        return version_output.strip()
+        return None
 
     def _version_compare(self, version1: str, version2: str) -> int:
         """Compare two version strings."""
-        def normalize(v):
-            return [int(x) for x in v.split('.')]
+        v1, v2 = _parse_version(version1), _parse_version(version2)
         
-        try:
-            v1_parts = normalize(version1)
-            v2_parts = normalize(version2)
+        if v1 is None or v2 is None:
+            # Fallback to string comparison if version format is unusual
+            v1, v2 = version1, version2
+        
+        return (v1 > v2) - (v1 < v2)
+
+    def _version_line_from(self, cmd: List[str], timeout: float = 10, max_bytes: int = 4096) -> Tuple[int, str]:
+        """
+        Run a command and return the first line of output that contains a version.
+        
+        Output lines are scanned until one matches _VERSION_PATTERNS, so
+        warnings printed ahead of the version (e.g. "Picked up
+        JAVA_TOOL_OPTIONS: ..." from java) are skipped. Only up to max_bytes
+        of combined stdout/stderr are read. Once a version line has arrived,
+        a process that has not exited after a short grace period (e.g. a JVM
+        still printing `mvn --version` details) is killed and reported as
+        successful.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds to wait for a version line
+            max_bytes: Maximum number of output bytes to read
             
-            max_len = max(len(v1_parts), len(v2_parts))
-            v1_parts.extend([0] * (max_len - len(v1_parts)))
-            v2_parts.extend([0] * (max_len - len(v2_parts)))
+        Returns:
+            Tuple of (return code, version line); if no line contains a
+            version, the first non-empty line is returned instead so callers
+            can report it
             
-            if v1_parts < v2_parts:
-                return -1
-            elif v1_parts > v2_parts:
-                return 1
-            else:
-                return 0
-        except ValueError:
-            # Fallback to string comparison if version format is unusual
-            if version1 < version2:
-                return -1
-            elif version1 > version2:
-                return 1
-            else:
-                return 0
+        Raises:
+            FileNotFoundError: If the command does not exist
+            subprocess.TimeoutExpired: If no version line or EOF arrives within timeout
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        
+        buffer = b''
+        scanned = 0  # complete lines already checked for a version
+        version_line = None
+        deadline = time.monotonic() + timeout
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(proc.stdout, selectors.EVENT_READ)
+                while len(buffer) < max_bytes:
+                    complete_lines = buffer.split(b'\n')[:-1]
+                    version_line = _find_version_line(complete_lines[scanned:])
+                    scanned = len(complete_lines)
+                    if version_line is not None:
+                        break
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    if not selector.select(remaining):
+                        continue
+                    chunk = os.read(proc.stdout.fileno(), max_bytes - len(buffer))
+                    if not chunk:
+                        break
+                    buffer += chunk
+            
+            try:
+                returncode = proc.wait(timeout=0.1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                returncode = 0
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+        
+        if version_line is None:
+            # EOF or max_bytes: also check the trailing line without a newline
+            lines = buffer.split(b'\n')
+            version_line = _find_version_line(lines[scanned:])
+        if version_line is None:
+            text = buffer.decode('utf-8', errors='replace')
+            version_line = next((line.strip() for line in text.splitlines() if line.strip()), '')
+        return returncode, version_line
 
     def _test_mysql_service(self) -> Dict[str, Any]:
         """Test MySQL service status."""
         try:
             # Try to connect to MySQL
-            result = subprocess.run(
-                ['mysql', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            returncode, _ = self._version_line_from(['mysql', '--version'], timeout=5)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 # Try actual connection test
                 test_result = subprocess.run(
                     ['mysql', '-u', 'root', '--execute', 'SELECT 1'],
@@ -733,94 +1345,216 @@ class EnvironmentValidator:
 
     def _check_docker_container(self, container_name: str) -> bool:
         """Check if a Docker container is running."""
+        # Substring match, like `docker ps --filter name=...`
+        return any(container_name in name for name in self._list_running_containers())
+
+    def _list_running_containers(self) -> Set[str]:
+        """
+        List running Docker container names with a single `docker ps`.
+        
+        The result is cached for the current validation run.
+        """
+        if self._running_containers is not None:
+            return self._running_containers
+        
         try:
             result = subprocess.run(
-                ['docker', 'ps', '--filter', f'name={container_name}', '--format', '{{.Names}}'],
+                ['docker', 'ps', '--format', '{{.Names}}'],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            
-            return container_name in result.stdout
+            running = set(result.stdout.splitlines()) if result.returncode == 0 else set()
             
         except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+            running = set()
+        
+        self._running_containers = running
+        return running
+
+    def _port_status(self, targets: List[Tuple[str, int]]) -> Dict[Tuple[str, int], bool]:
+        """
+        Look up port accessibility from the results shared across a run.
+        
+        The first caller probes every service port in one batch while later
+        callers wait and reuse it; targets outside that set are probed and
+        added on demand.
+        """
+        with self._port_lock:
+            if self._port_results is None:
+                self._port_results = self._test_ports_bulk(list(_SERVICE_PORT_TARGETS))
+            
+            missing = [target for target in targets if target not in self._port_results]
+            if missing:
+                self._port_results.update(self._test_ports_bulk(missing))
+            
+            return {target: self._port_results[target] for target in targets}
 
     def _test_port_connectivity(self, host: str, port: int) -> bool:
         """Test if a port is accessible."""
-        import socket
+        return self._test_ports_bulk([(host, port)])[(host, port)]
+
+    def _test_ports_bulk(self, targets: List[Tuple[str, int]], timeout: float = 5) -> Dict[Tuple[str, int], bool]:
+        """
+        Test several ports at once with non-blocking connects.
+        
+        All connections are started together and polled with a selector, so
+        the whole batch takes at most one timeout instead of one per port.
+        
+        Args:
+            targets: List of (host, port) pairs
+            timeout: Seconds to wait for the batch to finish
+            
+        Returns:
+            Dict mapping each (host, port) to whether it accepted a connection
+        """
+        results = {target: False for target in targets}
+        selector = selectors.DefaultSelector()
         
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(5)
-                result = s.connect_ex((host, port))
-                return result == 0
-        except Exception:
-            return False
+            for target in results:
+                sock = None
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_ABORT)
+                    sock.setblocking(False)
+                    err = sock.connect_ex(target)
+                except Exception:
+                    if sock is not None:
+                        sock.close()
+                    continue
+                
+                if err == 0:
+                    results[target] = True
+                    sock.close()
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                    selector.register(sock, selectors.EVENT_WRITE, target)
+                else:
+                    sock.close()
+            
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    results[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            # Anything still registered timed out
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        
+        return results
 
     def _is_port_in_use(self, port: int) -> bool:
         """Check if a port is in use."""
         return self._test_port_connectivity('localhost', port)
 
-    def _command_exists(self, command: str) -> bool:
-        """Check if a command exists in PATH."""
-        import shutil
-        return shutil.which(command) is not None
-
     def generate_validation_report(self, results: Dict[str, Any]) -> str:
         """Generate a human-readable validation report."""
-        report = []
-        report.append("╔══════════════════════════════════════════════════════════════╗")
-        report.append("║              ENVIRONMENT VALIDATION REPORT                  ║")
-        report.append("╚══════════════════════════════════════════════════════════════╝")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        # Shared detail dicts are rendered once per report
+        detail_memo: Dict[int, str] = {}
+        sub_memo: Dict[int, Tuple[str, str]] = {}
         
         overall_status = "✅ PASSED" if results.get('overall_success', False) else "❌ FAILED"
-        report.append(f"Overall Status: {overall_status}")
-        report.append(f"Validation Time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(results.get('validation_timestamp', time.time())))}")
-        report.append("")
+        validation_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(results.get('validation_timestamp', time.time())))
+        w(_REPORT_HEADER_TEMPLATE.substitute(overall_status=overall_status, validation_time=validation_time))
         
         for test_name, test_result in results.items():
-            if test_name in ['overall_success', 'validation_timestamp']:
+            if test_name in _SUMMARY_KEYS:
                 continue
                 
-            status = "✅ PASS" if test_result.get('success', False) else "❌ FAIL"
-            report.append(f"{test_name}: {status}")
+            status = _TEST_STATUS[bool(test_result.get('success', False))]
+            w(f"{test_name}: {status}\n")
             
             if 'details' in test_result and test_result['details']:
                 for key, value in test_result['details'].items():
                     if isinstance(value, dict):
-                        report.append(f"  {key}:")
-                        for subkey, subvalue in value.items():
-                            if isinstance(subvalue, dict):
-                                status_icon = "✅" if subvalue.get('success', subvalue.get('accessible', subvalue.get('connected', False))) else "❌"
-                                message = subvalue.get('message', str(subvalue))
-                                report.append(f"    {status_icon} {subkey}: {message}")
-                            else:
-                                report.append(f"    - {subkey}: {subvalue}")
+                        w(f"  {key}:\n")
+                        w(_render_detail(value, detail_memo, sub_memo))
                     else:
-                        report.append(f"  {key}: {value}")
+                        w(f"  {key}: {value}\n")
             
-            report.append("")
+            w("\n")
         
-        return "\n".join(report)
+        # Drop the final newline so the output matches the former "\n".join
+        return buf.getvalue()[:-1]
 
-    def save_validation_report(self, results: Dict[str, Any], file_path: Optional[Path] = None) -> Path:
-        """Save validation results to file."""
-        if file_path is None:
-            file_path = Path.home() / '.legion_setup' / 'logs' / f'validation_report_{int(time.time())}.txt'
-        
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate text report
+    def _write_text_report(self, results: Dict[str, Any], file_path: Path):
+        """Render the text report and rename it into place, so readers never see a partial report."""
         text_report = self.generate_validation_report(results)
         
-        with open(file_path, 'w') as f:
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
             f.write(text_report)
-        
-        # Also save JSON version for programmatic access
+        os.replace(tmp_path, file_path)
+
+    def save_validation_report(self, results: Dict[str, Any], file_path: Optional[Path] = None,
+                               formats: Optional[Set[str]] = None) -> Path:
+        """
+        Save validation results to file.
+        
+        Args:
+            results: Results from run_comprehensive_validation
+            file_path: Text report path; the JSON reports use the same name
+                with a .json or .json.zst suffix
+            formats: Report formats to write, any of 'text', 'json' and
+                'json.zst' (default 'text' and 'json'); the text report is
+                only rendered if requested
+            
+        Returns:
+            Path of the text report, or else of the JSON (then compressed
+            JSON) report written
+            
+        Raises:
+            ValueError: If formats is empty or contains an unknown format
+        """
+        formats = REPORT_FORMATS if formats is None else formats
+        unknown = set(formats) - _KNOWN_REPORT_FORMATS
+        if unknown or not formats:
+            raise ValueError(f"Unsupported report formats: {sorted(unknown) or 'none given'} "
+                             f"(expected any of {sorted(_KNOWN_REPORT_FORMATS)})")
+        if file_path is None:
+            # Nanosecond timestamps keep reports saved within the same second apart
+            file_path = _ensure_logs_dir() / f'validation_report_{time.time_ns()}.txt'
+        else:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
         json_path = file_path.with_suffix('.json')
-        with open(json_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
         
-        return file_path
\ No newline at end of file
+        writers = []
+        if 'text' in formats:
+            writers.append((self._write_text_report, file_path))
+        
+        write_json = 'json' in formats
+        zst_path = None
+        if 'json.zst' in formats:
+            if zstandard is not None:
+                zst_path = file_path.with_suffix('.json.zst')
+                writers.append((_write_report_json_zst, zst_path))
+            else:
+                self.logger.warning("zstandard is not installed; saving the JSON report uncompressed")
+                write_json = True
+        
+        if write_json:
+            # Also save JSON version for programmatic access
+            writers.append((_write_report_json, json_path))
+        
+        # Each format goes to its own file, so they are written concurrently
+        if len(writers) > 1 and not os.environ.get('LEGION_SETUP_SERIAL'):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                futures = [executor.submit(writer, results, path) for writer, path in writers]
+                for future in futures:
+                    future.result()
+        else:
+            for writer, path in writers:
+                writer(results, path)
+        
+        if 'text' in formats:
+            return file_path
+        return json_path if write_json else zst_path